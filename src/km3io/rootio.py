@@ -169,8 +169,9 @@ class EventReader:
         if key in self.nested_branches:
             fields = []
             # some fields are not always available, like `usr_names`
+            subbranch_keys = set(branch[key].keys())
             for to_field, from_field in self.nested_branches[key].items():
-                if from_field in branch[key].keys():
+                if from_field in subbranch_keys:
                     fields.append(to_field)
             log.debug(fields)
             return Branch(
@@ -294,7 +295,7 @@ class EventReader:
 
     def __actual_len__(self):
         """The raw number of events without any indexing/slicing magic"""
-        return len(self._fobj[self.event_path]["id"].array())
+        return self._fobj[self.event_path].num_entries
 
     def __repr__(self):
         length = len(self)
@@ -390,7 +391,7 @@ class Branch:
 
     def __actual_len__(self):
         """The raw number of events without any indexing/slicing magic"""
-        return len(self._branch[self._aliases["id"]].array())
+        return self._branch.num_entries
 
     def __repr__(self):
         length = len(self)
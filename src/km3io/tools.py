@@ -503,10 +503,11 @@ def usr(objects, field):
       Events, tracks, hits or whatever objects which have usr and usr_names
       fields (e.g. OfflineReader().events).
     """
-    if len(unique(ak.num(objects.usr_names))) > 1:
+    usr_names = objects.usr_names
+    if len(unique(ak.num(usr_names))) > 1:
         # let's do it the hard way
-        return ak.flatten(objects.usr[objects.usr_names == field])
-    available_fields = objects.usr_names[0].tolist()
+        return ak.flatten(objects.usr[usr_names == field])
+    available_fields = usr_names[0].tolist()
     idx = available_fields.index(field)
     return objects.usr[:, idx]
 
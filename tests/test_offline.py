@@ -1,14 +1,11 @@
 import unittest
 import numpy as np
-from pathlib import Path
-import uuid
 
 import awkward as ak
 from km3net_testdata import data_path
 
 from km3io import OfflineReader
 from km3io.offline import Header
-from km3io.tools import usr
 
 OFFLINE_FILE = OfflineReader(data_path("offline/km3net_offline.root"))
 OFFLINE_USR = OfflineReader(data_path("offline/usr-sample.root"))
@@ -21,13 +18,17 @@ OFFLINE_NUMUCC = OfflineReader(data_path("offline/numucc.root"))  # with mc data
 OFFLINE_MC_TRACK = OfflineReader(
     data_path("gseagen/gseagen_v7.0.0_numuCC_diffuse.aa.root")
 )
+OFFLINE_MC_TRACK_COUNTER = OfflineReader(
+    data_path("gseagen/DAT000001.gSeaGen.1.aa.root")
+)
 
 
 class TestOfflineReader(unittest.TestCase):
-    def setUp(self):
-        self.r = OFFLINE_FILE
-        self.nu = OFFLINE_NUMUCC
-        self.n_events = 10
+    @classmethod
+    def setUpClass(cls):
+        cls.r = OFFLINE_FILE
+        cls.nu = OFFLINE_NUMUCC
+        cls.n_events = 10
 
     def test_context_manager(self):
         filename = OFFLINE_FILE
@@ -158,87 +159,90 @@ class TestHeader(unittest.TestCase):
 
 
 class TestOfflineEvents(unittest.TestCase):
-    def setUp(self):
-        self.events = OFFLINE_FILE.events
-        self.n_events = 10
-        self.det_id = [44] * self.n_events
-        self.n_hits = [176, 125, 318, 157, 83, 60, 71, 84, 255, 105]
-        self.n_tracks = [56, 55, 56, 56, 56, 56, 56, 56, 54, 56]
-        self.t_sec = [
-            1567036818,
-            1567036818,
-            1567036820,
-            1567036816,
-            1567036816,
-            1567036816,
-            1567036822,
-            1567036818,
-            1567036818,
-            1567036820,
-        ]
-        self.t_ns = [
-            200000000,
-            300000000,
-            200000000,
-            500000000,
-            500000000,
-            500000000,
-            200000000,
-            500000000,
-            500000000,
-            400000000,
-        ]
+    @classmethod
+    def setUpClass(cls):
+        cls.events = OFFLINE_FILE.events
+        cls.n_events = 10
+        cls.det_id = np.full(cls.n_events, 44)
+        cls.n_hits = np.array([176, 125, 318, 157, 83, 60, 71, 84, 255, 105])
+        cls.n_tracks = np.array([56, 55, 56, 56, 56, 56, 56, 56, 54, 56])
+        cls.t_sec = np.array(
+            [
+                1567036818,
+                1567036818,
+                1567036820,
+                1567036816,
+                1567036816,
+                1567036816,
+                1567036822,
+                1567036818,
+                1567036818,
+                1567036820,
+            ]
+        )
+        cls.t_ns = np.array(
+            [
+                200000000,
+                300000000,
+                200000000,
+                500000000,
+                500000000,
+                500000000,
+                200000000,
+                500000000,
+                500000000,
+                400000000,
+            ]
+        )
 
     def test_len(self):
         assert self.n_events == len(self.events)
 
     def test_attributes(self):
         assert self.n_events == len(self.events.det_id)
-        self.assertListEqual(self.det_id, list(self.events.det_id))
+        np.testing.assert_array_equal(self.events.det_id, self.det_id)
         print(self.n_hits)
         print(self.events.hits)
-        self.assertListEqual(self.n_hits, list(self.events.n_hits))
-        self.assertListEqual(self.n_tracks, list(self.events.n_tracks))
-        self.assertListEqual(self.t_sec, list(self.events.t_sec))
-        self.assertListEqual(self.t_ns, list(self.events.t_ns))
+        np.testing.assert_array_equal(self.events.n_hits, self.n_hits)
+        np.testing.assert_array_equal(self.events.n_tracks, self.n_tracks)
+        np.testing.assert_array_equal(self.events.t_sec, self.t_sec)
+        np.testing.assert_array_equal(self.events.t_ns, self.t_ns)
 
     def test_keys(self):
-        assert np.allclose(self.n_hits, self.events["n_hits"].tolist())
-        assert np.allclose(self.n_tracks, self.events["n_tracks"].tolist())
-        assert np.allclose(self.t_sec, self.events["t_sec"].tolist())
-        assert np.allclose(self.t_ns, self.events["t_ns"].tolist())
+        np.testing.assert_array_equal(self.events["n_hits"], self.n_hits)
+        np.testing.assert_array_equal(self.events["n_tracks"], self.n_tracks)
+        np.testing.assert_array_equal(self.events["t_sec"], self.t_sec)
+        np.testing.assert_array_equal(self.events["t_ns"], self.t_ns)
 
     def test_slicing(self):
         s = slice(2, 8, 2)
         s_events = self.events[s]
         assert 3 == len(s_events)
-        self.assertListEqual(self.n_hits[s], list(s_events.n_hits))
-        self.assertListEqual(self.n_tracks[s], list(s_events.n_tracks))
-        self.assertListEqual(self.t_sec[s], list(s_events.t_sec))
-        self.assertListEqual(self.t_ns[s], list(s_events.t_ns))
+        np.testing.assert_array_equal(s_events.n_hits, self.n_hits[s])
+        np.testing.assert_array_equal(s_events.n_tracks, self.n_tracks[s])
+        np.testing.assert_array_equal(s_events.t_sec, self.t_sec[s])
+        np.testing.assert_array_equal(s_events.t_ns, self.t_ns[s])
 
     def test_slicing_consistency(self):
         for s in [slice(1, 3), slice(2, 7, 3)]:
-            assert np.allclose(
-                self.events[s].n_hits.tolist(), self.events.n_hits[s].tolist()
-            )
+            np.testing.assert_array_equal(self.events[s].n_hits, self.events.n_hits[s])
 
     def test_index_consistency(self):
         for i in [0, 2, 5]:
-            assert np.allclose(self.events[i].n_hits, self.events.n_hits[i])
+            np.testing.assert_array_equal(self.events[i].n_hits, self.events.n_hits[i])
 
     def test_index_chaining(self):
-        assert np.allclose(
-            self.events[3:5].n_hits.tolist(), self.events.n_hits[3:5].tolist()
+        np.testing.assert_array_equal(self.events[3:5].n_hits, self.events.n_hits[3:5])
+        np.testing.assert_array_equal(
+            self.events[3:5][0].n_hits, self.events.n_hits[3:5][0]
         )
-        assert np.allclose(self.events[3:5][0].n_hits, self.events.n_hits[3:5][0])
 
     def test_index_chaining_on_nested_branches_aka_records(self):
-        assert np.allclose(
+        np.testing.assert_array_equal(
             self.events[3:5].hits[1].dom_id[4],
             self.events.hits[3:5][1].dom_id[4],
         )
-        assert np.allclose(
+        np.testing.assert_array_equal(
             self.events.hits[3:5][1].dom_id[4],
             self.events[3:5][1].hits.dom_id[4],
         )
@@ -259,7 +263,7 @@ class TestOfflineEvents(unittest.TestCase):
 
     def test_iteration_2(self):
         n_hits = [len(e.hits.id) for e in self.events]
-        assert np.allclose(n_hits, ak.num(self.events.hits.id, axis=1).tolist())
+        np.testing.assert_array_equal(n_hits, ak.num(self.events.hits.id, axis=1))
 
     def test_iteration_over_slices(self):
         ids = [e.id for e in self.events[2:5]]
@@ -286,63 +290,73 @@ class TestOfflineEvents(unittest.TestCase):
 
     def test_repr(self):
         assert str(self.n_events) in repr(self.events)
+        assert "3/10" in repr(self.events[2:5])
 
 
 class TestOfflineHits(unittest.TestCase):
-    def setUp(self):
-        self.hits = OFFLINE_FILE.events.hits
-        self.n_hits = 10
-        self.dom_id = {
-            0: [
-                806451572,
-                806451572,
-                806451572,
-                806451572,
-                806455814,
-                806455814,
-                806455814,
-                806483369,
-                806483369,
-                806483369,
-            ],
-            5: [
-                806455814,
-                806487219,
-                806487219,
-                806487219,
-                806487226,
-                808432835,
-                808432835,
-                808432835,
-                808432835,
-                808432835,
-            ],
+    @classmethod
+    def setUpClass(cls):
+        cls.hits = OFFLINE_FILE.events.hits
+        cls.n_hits = 10
+        cls.dom_id = {
+            0: np.array(
+                [
+                    806451572,
+                    806451572,
+                    806451572,
+                    806451572,
+                    806455814,
+                    806455814,
+                    806455814,
+                    806483369,
+                    806483369,
+                    806483369,
+                ]
+            ),
+            5: np.array(
+                [
+                    806455814,
+                    806487219,
+                    806487219,
+                    806487219,
+                    806487226,
+                    808432835,
+                    808432835,
+                    808432835,
+                    808432835,
+                    808432835,
+                ]
+            ),
         }
-        self.t = {
-            0: [
-                70104010.0,
-                70104016.0,
-                70104192.0,
-                70104123.0,
-                70103096.0,
-                70103797.0,
-                70103796.0,
-                70104191.0,
-                70104223.0,
-                70104181.0,
-            ],
-            5: [
-                81861237.0,
-                81859608.0,
-                81860586.0,
-                81861062.0,
-                81860357.0,
-                81860627.0,
-                81860628.0,
-                81860625.0,
-                81860627.0,
-                81860629.0,
-            ],
+        cls.t = {
+            0: np.array(
+                [
+                    70104010.0,
+                    70104016.0,
+                    70104192.0,
+                    70104123.0,
+                    70103096.0,
+                    70103797.0,
+                    70103796.0,
+                    70104191.0,
+                    70104223.0,
+                    70104181.0,
+                ]
+            ),
+            5: np.array(
+                [
+                    81861237.0,
+                    81859608.0,
+                    81860586.0,
+                    81861062.0,
+                    81860357.0,
+                    81860627.0,
+                    81860628.0,
+                    81860625.0,
+                    81860627.0,
+                    81860629.0,
+                ]
+            ),
         }
 
     def test_fields_work_as_keys_and_attributes(self):
@@ -351,53 +365,55 @@ class TestOfflineHits(unittest.TestCase):
             self.hits[key]
 
     def test_channel_ids(self):
-        self.assertTrue(all(c >= 0 for c in ak.min(self.hits.channel_id, axis=1)))
-        self.assertTrue(all(c < 31 for c in ak.max(self.hits.channel_id, axis=1)))
+        channel_ids = self.hits.channel_id
+        self.assertGreaterEqual(ak.min(channel_ids), 0)
+        self.assertLess(ak.max(channel_ids), 31)
 
     def test_repr(self):
         assert str(self.n_hits) in repr(self.hits)
+        assert "3/10" in repr(self.hits[2:5])
 
     def test_attributes(self):
         for idx, dom_id in self.dom_id.items():
-            self.assertListEqual(dom_id, list(self.hits.dom_id[idx][: len(dom_id)]))
+            np.testing.assert_array_equal(self.hits.dom_id[idx][: len(dom_id)], dom_id)
         for idx, t in self.t.items():
-            assert np.allclose(t, self.hits.t[idx][: len(t)].tolist())
+            np.testing.assert_allclose(self.hits.t[idx][: len(t)], t)
 
     def test_slicing(self):
         s = slice(2, 8, 2)
         s_hits = self.hits[s]
         assert 3 == len(s_hits)
         for idx, dom_id in self.dom_id.items():
-            self.assertListEqual(dom_id[s], list(self.hits.dom_id[idx][s]))
+            np.testing.assert_array_equal(self.hits.dom_id[idx][s], dom_id[s])
         for idx, t in self.t.items():
-            self.assertListEqual(t[s], list(self.hits.t[idx][s]))
+            np.testing.assert_array_equal(self.hits.t[idx][s], t[s])
 
     def test_slicing_consistency(self):
         for s in [slice(1, 3), slice(2, 7, 3)]:
             for idx in range(3):
-                assert np.allclose(
-                    self.hits.dom_id[idx][s].tolist(), self.hits[idx].dom_id[s].tolist()
+                np.testing.assert_array_equal(
+                    self.hits.dom_id[idx][s], self.hits[idx].dom_id[s]
                 )
-                assert np.allclose(
-                    OFFLINE_FILE.events[idx].hits.dom_id[s].tolist(),
-                    self.hits.dom_id[idx][s].tolist(),
+                np.testing.assert_array_equal(
+                    OFFLINE_FILE.events[idx].hits.dom_id[s],
+                    self.hits.dom_id[idx][s],
                 )
 
     def test_index_consistency(self):
         for idx, dom_ids in self.dom_id.items():
-            assert np.allclose(
-                self.hits[idx].dom_id[: self.n_hits].tolist(), dom_ids[: self.n_hits]
+            np.testing.assert_array_equal(
+                self.hits[idx].dom_id[: self.n_hits], dom_ids[: self.n_hits]
             )
-            assert np.allclose(
-                OFFLINE_FILE.events[idx].hits.dom_id[: self.n_hits].tolist(),
+            np.testing.assert_array_equal(
+                OFFLINE_FILE.events[idx].hits.dom_id[: self.n_hits],
                 dom_ids[: self.n_hits],
             )
         for idx, ts in self.t.items():
-            assert np.allclose(
-                self.hits[idx].t[: self.n_hits].tolist(), ts[: self.n_hits]
+            np.testing.assert_allclose(
+                self.hits[idx].t[: self.n_hits], ts[: self.n_hits]
             )
-            assert np.allclose(
-                OFFLINE_FILE.events[idx].hits.t[: self.n_hits].tolist(),
+            np.testing.assert_allclose(
+                OFFLINE_FILE.events[idx].hits.t[: self.n_hits],
                 ts[: self.n_hits],
             )
 
@@ -412,15 +428,16 @@ class TestOfflineHits(unittest.TestCase):
 
 
 class TestOfflineTracks(unittest.TestCase):
-    def setUp(self):
-        self.f = OFFLINE_FILE
-        self.tracks = OFFLINE_FILE.events.tracks
-        self.tracks_numucc = OFFLINE_NUMUCC
-        self.mc_tracks = OFFLINE_MC_TRACK.mc_tracks
-        self.mc_tracks_old = OFFLINE_MC_TRACK_USR.mc_tracks
-        self.n_events = 10
-        self.status = [100, 5, 11, 15, 1, 12, 12, 12, 12, 12]
-        self.mother_id = [-1, -1, 1, 1, 0, 2, 5, 5, 6, 8]
+    @classmethod
+    def setUpClass(cls):
+        cls.f = OFFLINE_FILE
+        cls.tracks = OFFLINE_FILE.events.tracks
+        cls.tracks_numucc = OFFLINE_NUMUCC
+        cls.mc_tracks = OFFLINE_MC_TRACK.mc_tracks
+        cls.mc_tracks_old = OFFLINE_MC_TRACK_USR.mc_tracks
+        cls.n_events = 10
+        cls.status = [100, 5, 11, 15, 1, 12, 12, 12, 12, 12]
+        cls.mother_id = [-1, -1, 1, 1, 0, 2, 5, 5, 6, 8]
 
     def test_fields(self):
         for field in [
@@ -442,10 +459,10 @@ class TestOfflineTracks(unittest.TestCase):
             getattr(self.tracks, field)
 
     def test_status(self):
-        assert np.allclose(self.status, self.mc_tracks[1].status[:10].tolist())
+        np.testing.assert_array_equal(self.status, self.mc_tracks[1].status[:10])
 
     def test_mother_id(self):
-        assert np.allclose(self.mother_id, self.mc_tracks[1].mother_id[:10].tolist())
+        np.testing.assert_array_equal(self.mother_id, self.mc_tracks[1].mother_id[:10])
 
     def test_attribute_error_raised_for_older_files(self):
         with self.assertRaises(AttributeError):
@@ -454,12 +471,13 @@ class TestOfflineTracks(unittest.TestCase):
             self.mc_tracks_old[1].status
 
     def test_item_selection(self):
-        self.assertListEqual(
-            list(self.tracks[0].dir_z[:2]), [-0.872885221293917, -0.872885221293917]
+        np.testing.assert_array_equal(
+            self.tracks[0].dir_z[:2], [-0.872885221293917, -0.872885221293917]
         )
 
     def test_repr(self):
         assert "10" in repr(self.tracks)
+        assert "3/10" in repr(self.tracks[2:5])
 
     def test_slicing(self):
         tracks = self.tracks
@@ -469,6 +487,7 @@ class TestOfflineTracks(unittest.TestCase):
         assert 5 == len(track_selection)
         track_selection_2 = tracks[1:3]
         assert 2 == len(track_selection_2)
+        first_track_energies = tracks.E[:, 0]
         for _slice in [
             slice(0, 1),
             slice(0, 2),
@@ -476,8 +495,8 @@ class TestOfflineTracks(unittest.TestCase):
             slice(3, -2),
         ]:
             print(f"checking {_slice}")
-            self.assertListEqual(
-                list(tracks.E[:, 0][_slice]), list(tracks[_slice].E[:, 0])
+            np.testing.assert_array_equal(
+                first_track_energies[_slice], tracks[_slice].E[:, 0]
             )
 
     def test_nested_indexing(self):
@@ -493,24 +512,25 @@ class TestOfflineTracks(unittest.TestCase):
 
 class TestMisc(unittest.TestCase):
     def test_mc_tracks_counter(self):
-        r = OfflineReader(data_path("gseagen/DAT000001.gSeaGen.1.aa.root"))
-        np.testing.assert_allclose(
-            [0, 0, 6, 7, 0, 0, 2, 53, 0, 0, 6, 57, 0], r.mc_tracks.counter[0][:13]
+        np.testing.assert_array_equal(
+            [0, 0, 6, 7, 0, 0, 2, 53, 0, 0, 6, 57, 0],
+            OFFLINE_MC_TRACK_COUNTER.mc_tracks.counter[0][:13],
         )
 
 
 class TestBranchIndexingMagic(unittest.TestCase):
-    def setUp(self):
-        self.events = OFFLINE_FILE.events
+    @classmethod
+    def setUpClass(cls):
+        cls.events = OFFLINE_FILE.events
 
     def test_slicing_magic(self):
         self.assertEqual(318, self.events[2:4].n_hits[0])
-        assert np.allclose(
+        np.testing.assert_array_equal(
             self.events[3].tracks.dir_z[10], self.events.tracks.dir_z[3, 10]
         )
-        assert np.allclose(
-            self.events[3:6].tracks.pos_y[:, 0].tolist(),
-            self.events.tracks.pos_y[3:6, 0].tolist(),
+        np.testing.assert_array_equal(
+            self.events[3:6].tracks.pos_y[:, 0],
+            self.events.tracks.pos_y[3:6, 0],
         )
 
     def test_selecting_specific_items_via_a_list(self):
@@ -529,16 +549,16 @@ class TestBranchIndexingMagic(unittest.TestCase):
 class TestBranchHighLevelAccessor(unittest.TestCase):
     def test_tracks_arrays(self):
         pos_xy = OFFLINE_FILE.tracks.arrays(["pos_x", "pos_y"])
-        n = len(pos_xy)
-        for i in range(n):
-            assert np.allclose(
-                OFFLINE_FILE.tracks.pos_x.tolist()[i], pos_xy.pos_x.tolist()[i]
-            )
+        pos_x = OFFLINE_FILE.tracks.pos_x
+        assert len(pos_xy) == len(pos_x)
+        np.testing.assert_array_equal(ak.num(pos_x), ak.num(pos_xy.pos_x))
+        np.testing.assert_allclose(ak.flatten(pos_x), ak.flatten(pos_xy.pos_x))
 
 
 class TestUsr(unittest.TestCase):
-    def setUp(self):
-        self.f = OFFLINE_USR
+    @classmethod
+    def setUpClass(cls):
+        cls.f = OFFLINE_USR
 
     def test_str_flat(self):
         print(self.f.events.usr)
@@ -569,27 +589,18 @@ class TestUsr(unittest.TestCase):
 
 
 class TestMcTrackUsr(unittest.TestCase):
-    def setUp(self):
-        self.f = OFFLINE_MC_TRACK_USR
+    @classmethod
+    def setUpClass(cls):
+        cls.f = OFFLINE_MC_TRACK_USR
+        cls.mc_tracks = cls.f.events.mc_tracks
 
     def test_usr_names(self):
-        n_tracks = len(self.f.events)
+        usr_names = self.mc_tracks.usr_names
         for i in range(3):
-            self.assertListEqual(
-                ["bx", "by", "ichan", "cc"],
-                self.f.events.mc_tracks.usr_names[i][0].tolist(),
-            )
-            self.assertListEqual(
-                ["energy_lost_in_can"],
-                self.f.events.mc_tracks.usr_names[i][1].tolist(),
-            )
+            self.assertListEqual(["bx", "by", "ichan", "cc"], usr_names[i][0].tolist())
+            self.assertListEqual(["energy_lost_in_can"], usr_names[i][1].tolist())
 
     def test_usr(self):
-        assert np.allclose(
-            [0.0487, 0.0588, 3, 2],
-            self.f.events.mc_tracks.usr[0][0].tolist(),
-            atol=0.0001,
-        )
-        assert np.allclose(
-            [0.147, 0.4, 3, 2], self.f.events.mc_tracks.usr[1][0].tolist(), atol=0.001
-        )
+        usr = self.mc_tracks.usr
+        np.testing.assert_allclose(usr[0][0], [0.0487, 0.0588, 3, 2], atol=0.0001)
+        np.testing.assert_allclose(usr[1][0], [0.147, 0.4, 3, 2], atol=0.001)
@@ -3,7 +3,6 @@
 import unittest
 import awkward as ak
 import numpy as np
-from pathlib import Path
 
 from numpy.testing import assert_almost_equal, assert_allclose
 
@@ -21,7 +20,6 @@ from km3io.tools import (
     count_nested,
     mask,
     best_track,
-    get_w2list_param,
     get_multiplicity,
     has_jmuon,
     has_jshower,
@@ -648,19 +646,19 @@ class TestIsCC(unittest.TestCase):
 
 class TestUsr(unittest.TestCase):
     def test_event_usr(self):
-        assert np.allclose(
+        assert_allclose(
+            usr(OFFLINE_USR.events, "CoC"),
             [118.6302815337638, 44.33580521344907, 99.93916717621543],
-            usr(OFFLINE_USR.events, "CoC").tolist(),
         )
-        assert np.allclose(
+        assert_allclose(
+            usr(OFFLINE_USR.events, "DeltaPosZ"),
             [37.51967774166617, -10.280346193553832, 13.67595659707355],
-            usr(OFFLINE_USR.events, "DeltaPosZ").tolist(),
         )
 
     def test_mc_tracks_usr(self):
-        assert np.allclose(
+        assert_allclose(
+            usr(OFFLINE_MC_TRACK_USR.mc_tracks[0], "bx"),
             [0.0487],
-            usr(OFFLINE_MC_TRACK_USR.mc_tracks[0], "bx").tolist(),
             atol=0.0001,
         )
 